@@ -5,17 +5,14 @@
 #
 
 import asyncio
+import functools
+import io
 import os
 import sys
+from typing import TYPE_CHECKING
 
-import aiohttp
-from deepgram.clients.listen.v1.websocket.options import LiveOptions
 from dotenv import load_dotenv
 from loguru import logger
-from PIL import Image
-from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
-from pipecat.audio.vad.silero import SileroVADAnalyzer
-from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
@@ -31,10 +28,6 @@ from pipecat.frames.frames import (
     TranscriptionFrame,
 )
 from pipecat.metrics.metrics import SmartTurnMetricsData
-from pipecat.pipeline.pipeline import Pipeline
-from pipecat.pipeline.runner import PipelineRunner
-from pipecat.pipeline.task import PipelineParams, PipelineTask
-from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.processors.frameworks.rtvi import (
     RTVIConfig,
@@ -47,94 +40,176 @@ from pipecat.processors.frameworks.rtvi import (
     RTVIBotLLMTextMessage,
     RTVIBotTranscriptionMessage,
 )
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.google.llm import GoogleLLMService
-from pipecat.transports.daily.transport import DailyParams, DailyTransport
-from pipecatcloud.agent import DailySessionArguments
 
 import re
 import time
-from collections import deque
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import dataclass
+from itertools import islice
+
+if TYPE_CHECKING:
+    from pipecat.transports.daily.transport import DailyTransport
+    from pipecatcloud.agent import DailySessionArguments
 
 load_dotenv(override=True)
 
 # Check if we're in local development mode
 LOCAL = os.getenv("LOCAL_RUN")
 
+LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
+
 logger.remove()
-logger.add(sys.stderr, level="DEBUG")
+logger.add(sys.stderr, level=LOG_LEVEL)
+
+# Resolved once so per-frame debug logging costs a single bool check when disabled.
+_DEBUG_ENABLED = logger.level(LOG_LEVEL).no <= logger.level("DEBUG").no
 
-sprites = []
 script_dir = os.path.dirname(__file__)
 
-# Load sequential animation frames
-for i in range(1, 26):
-    # Build the full path to the image file
-    full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
-    # Get the filename without the extension to use as the dictionary key
-    # Open the image and convert it to bytes
-    with Image.open(full_path) as img:
-        sprites.append(OutputImageRawFrame(image=img.tobytes(), size=img.size, format=img.format))
 
-# Create a smooth animation by adding reversed frames
-flipped = sprites[::-1]
-sprites.extend(flipped)
+@functools.lru_cache(maxsize=1)
+def _load_sprites() -> tuple[OutputImageRawFrame, SpriteFrame]:
+    """Load the robot animation frames.
+
+    Returns:
+        The static frame shown while listening and the animation played while talking.
+    """
+    from PIL import Image
+
+    sprites = []
+
+    # Load sequential animation frames
+    for i in range(1, 26):
+        # Build the full path to the image file
+        full_path = os.path.join(script_dir, f"assets/robot0{i}.png")
+        # Decode the image into a raw RGB pixel buffer, matching the camera's
+        # default color format. The transport hands frame.image to Daily as
+        # bytes, so each frame keeps its own buffer.
+        with Image.open(full_path) as img:
+            pixels = img.convert("RGB").tobytes()
+            sprites.append(OutputImageRawFrame(image=pixels, size=img.size, format="RGB"))
+
+    # Create a smooth animation by adding reversed frames (the same frame objects
+    # are reused, so no pixel data is duplicated)
+    sprites.extend(sprites[::-1])
+
+    # Define static and animated states
+    quiet_frame = sprites[0]  # Static frame for when bot is listening
+    talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
 
-# Define static and animated states
-quiet_frame = sprites[0]  # Static frame for when bot is listening
-talking_frame = SpriteFrame(images=sprites)  # Animation sequence for when bot is talking
+    return quiet_frame, talking_frame
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationEntry:
     speaker: str
     text: str
-    timestamp: float
+    timestamp: float  # time.monotonic() value
     is_command: bool = False
 
 
 class ConversationHistory:
-    """Simple in-memory conversation history for logging and summaries."""
+    """Simple in-memory conversation history for logging and summaries.
+
+    Entries are timestamped with ``time.monotonic()`` so pruning is immune to
+    wall-clock adjustments.
+
+    The history grows until it holds ``2 * max_entries`` entries and then drops
+    the oldest ``max_entries`` in one step, so the retained prefix stays stable
+    between truncations instead of shifting on every append.
+    """
 
     def __init__(self, *, max_age_secs: float = 300.0, max_entries: int = 200):
-        self._entries: deque[ConversationEntry] = deque(maxlen=max_entries)
+        # Entries are stored column-wise in lists that always share the same
+        # length. Evicted entries stay in place before ``_head`` until the lists
+        # are compacted, so the timestamps remain contiguous for bisect.
+        self._ts: list[float] = []
+        self._speakers: list[str] = []
+        self._texts: list[str] = []
+        self._cmd: list[bool] = []
+        self._head = 0
         self._max_age_secs = max_age_secs
+        self._max_entries = max_entries
+
+    def __len__(self) -> int:
+        return len(self._ts) - self._head
 
     def add(self, speaker: str, text: str, *, is_command: bool = False):
-        entry = ConversationEntry(
-            speaker=speaker,
-            text=text.strip(),
-            timestamp=time.time(),
-            is_command=is_command,
-        )
-        if not entry.text:
+        text = text.strip()
+        if not text:
             return
-        self._entries.append(entry)
-        self._prune()
-
-    def _prune(self):
-        cutoff = time.time() - self._max_age_secs
-        while self._entries and self._entries[0].timestamp < cutoff:
-            self._entries.popleft()
+        now = time.monotonic()
+        self._ts.append(now)
+        self._speakers.append(speaker)
+        self._texts.append(text)
+        self._cmd.append(is_command)
+        self._prune(now)
+
+    def _prune(self, now: float):
+        if len(self) >= 2 * self._max_entries:
+            self._evict(self._max_entries)
+        cutoff = now - self._max_age_secs
+        expired = bisect_left(self._ts, cutoff, self._head) - self._head
+        if expired:
+            self._evict(expired)
+
+    def _evict(self, count: int):
+        self._head += count
+        # Compact only once the dead prefix is as large as the retained window,
+        # which keeps eviction amortised O(1).
+        if self._head >= self._max_entries:
+            del self._ts[: self._head]
+            del self._speakers[: self._head]
+            del self._texts[: self._head]
+            del self._cmd[: self._head]
+            self._head = 0
+
+    def recent_iter(
+        self, window_secs: float, *, include_commands: bool = False, reverse: bool = False
+    ) -> Iterator[ConversationEntry]:
+        """Lazily yield entries newer than ``window_secs``.
+
+        With ``reverse=True`` entries are yielded newest first, which lets
+        callers that only need the latest few stop early.
+        """
+        cutoff = time.monotonic() - window_secs
+        if reverse:
+            indices = range(len(self._ts) - 1, self._head - 1, -1)
+        else:
+            # Timestamps are appended in non-decreasing order, so bisect finds the window start.
+            indices = range(bisect_left(self._ts, cutoff, self._head), len(self._ts))
+        for i in indices:
+            if self._ts[i] < cutoff:
+                break
+            if include_commands or not self._cmd[i]:
+                yield ConversationEntry(
+                    speaker=self._speakers[i],
+                    text=self._texts[i],
+                    timestamp=self._ts[i],
+                    is_command=self._cmd[i],
+                )
 
     def recent(self, window_secs: float, *, include_commands: bool = False) -> list[ConversationEntry]:
-        cutoff = time.time() - window_secs
-        return [
-            entry
-            for entry in self._entries
-            if entry.timestamp >= cutoff and (include_commands or not entry.is_command)
-        ]
+        return list(self.recent_iter(window_secs, include_commands=include_commands))
 
 
-SUMMARY_COMMANDS = {"summary", "summarize"}
+SUMMARY_COMMANDS = frozenset({"summary", "summarize"})
 SUMMARY_WINDOW_SECS = 10.0
+SUMMARY_MAX_ENTRIES = 3
+SUMMARY_COMMAND_MAX_CHARS = 16  # longest command plus room for punctuation/whitespace
+LLM_CHUNK_FLUSH_SECS = 0.02
+
+_NON_WORD_RE = re.compile(r"[^\w\s]", flags=re.UNICODE)
+_WS_RE = re.compile(r"\s+")
 
 
 def sanitize_command(text: str) -> str:
-    lowered = text.lower()
-    cleaned = re.sub(r"[^\w\s]", " ", lowered, flags=re.UNICODE)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    stripped = text.strip()
+    # Fast path: a bare ASCII word such as "summary" needs no regex cleanup.
+    if stripped.isascii() and stripped.isalpha():
+        return stripped.lower()
+    return _WS_RE.sub(" ", _NON_WORD_RE.sub(" ", text.lower())).strip()
 
 
 def build_summary(entries: list[ConversationEntry]) -> list[str]:
@@ -142,7 +217,7 @@ def build_summary(entries: list[ConversationEntry]) -> list[str]:
         return []
 
     # Provide up to three of the most recent messages as a lightweight summary.
-    recent = entries[-3:]
+    recent = entries[-SUMMARY_MAX_ENTRIES:]
     bullets = []
     for entry in recent:
         prefix = "You" if entry.speaker == "user" else "Bot"
@@ -150,19 +225,24 @@ def build_summary(entries: list[ConversationEntry]) -> list[str]:
     return bullets
 
 
-class TalkingAnimation(FrameProcessor):
-    """Manages the bot's visual animation states.
+async def _noop_async(*args, **kwargs):
+    pass
 
-    Switches between static (listening) and animated (talking) states based on
-    the bot's current speaking status.
+
+class FrameDispatchProcessor(FrameProcessor):
+    """Frame processor that routes frames to handlers keyed by frame class.
+
+    Subclasses fill ``self._handlers`` with ``{FrameClass: handler}``. Lookups
+    use ``type(frame)``, so frame subclasses must be registered explicitly.
+    Every frame is forwarded downstream after its handler, if any, has run.
     """
 
     def __init__(self):
         super().__init__()
-        self._is_talking = False
+        self._handlers: dict[type[Frame], Callable[[Frame], Awaitable[None]]] = {}
 
     async def process_frame(self, frame: Frame, direction: FrameDirection):
-        """Process incoming frames and update animation state.
+        """Process incoming frames and dispatch them to the matching handler.
 
         Args:
             frame: The incoming frame to process
@@ -170,69 +250,90 @@ class TalkingAnimation(FrameProcessor):
         """
         await super().process_frame(frame, direction)
 
-        # Switch to talking animation when bot starts speaking
-        if isinstance(frame, BotStartedSpeakingFrame):
-            if not self._is_talking:
-                await self.push_frame(talking_frame)
-                self._is_talking = True
-        # Return to static frame when bot stops speaking
-        elif isinstance(frame, BotStoppedSpeakingFrame):
-            await self.push_frame(quiet_frame)
-            self._is_talking = False
+        handler = self._handlers.get(type(frame))
+        if handler is not None:
+            await handler(frame)
 
         await self.push_frame(frame, direction)
 
 
-class SmartTurnMetricsProcessor(FrameProcessor):
+class TalkingAnimation(FrameDispatchProcessor):
+    """Manages the bot's visual animation states.
+
+    Switches between static (listening) and animated (talking) states based on
+    the bot's current speaking status.
+    """
+
+    def __init__(self, quiet_frame: OutputImageRawFrame, talking_frame: SpriteFrame):
+        super().__init__()
+        self._quiet_frame = quiet_frame
+        self._talking_frame = talking_frame
+        self._is_talking = False
+        self._handlers = {
+            BotStartedSpeakingFrame: self._on_bot_started_speaking,
+            BotStoppedSpeakingFrame: self._on_bot_stopped_speaking,
+        }
+
+    async def _on_bot_started_speaking(self, frame: BotStartedSpeakingFrame):
+        # Switch to talking animation when bot starts speaking
+        if not self._is_talking:
+            await self.push_frame(self._talking_frame)
+            self._is_talking = True
+
+    async def _on_bot_stopped_speaking(self, frame: BotStoppedSpeakingFrame):
+        # Return to static frame when bot stops speaking
+        await self.push_frame(self._quiet_frame)
+        self._is_talking = False
+
+
+class SmartTurnMetricsProcessor(FrameDispatchProcessor):
     """Processes the metrics data from Smart Turn Analyzer.
 
     This processor is responsible for handling smart turn metrics data
     and forwarding it to the client UI via RTVI.
     """
 
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        """Process incoming frames and handle Smart Turn metrics.
+    def __init__(self):
+        super().__init__()
+        self._handlers = {MetricsFrame: self._on_metrics}
 
-        Args:
-            frame: The incoming frame to process
-            direction: The direction of frame flow in the pipeline
-        """
-        await super().process_frame(frame, direction)
+    async def _on_metrics(self, frame: MetricsFrame):
+        for metrics in frame.data:
+            if isinstance(metrics, SmartTurnMetricsData):
+                logger.info(f"Smart Turn metrics: {metrics}")
 
-        # Handle Smart Turn metrics
-        if isinstance(frame, MetricsFrame):
-            for metrics in frame.data:
-                if isinstance(metrics, SmartTurnMetricsData):
-                    logger.info(f"Smart Turn metrics: {metrics}")
-
-                    # Create a payload with the smart turn prediction data
-                    smart_turn_data = {
-                        "type": "smart_turn_result",
-                        "is_complete": metrics.is_complete,
-                        "probability": metrics.probability,
-                        "inference_time_ms": metrics.inference_time_ms,
-                        "server_total_time_ms": metrics.server_total_time_ms,
-                        "e2e_processing_time_ms": metrics.e2e_processing_time_ms,
-                    }
-
-                    # Send the data to the client via RTVI
-                    rtvi_frame = RTVIServerMessageFrame(data=smart_turn_data)
-                    await self.push_frame(rtvi_frame, FrameDirection.UPSTREAM)
+                # Create a payload with the smart turn prediction data
+                smart_turn_data = {
+                    "type": "smart_turn_result",
+                    "is_complete": metrics.is_complete,
+                    "probability": metrics.probability,
+                    "inference_time_ms": metrics.inference_time_ms,
+                    "server_total_time_ms": metrics.server_total_time_ms,
+                    "e2e_processing_time_ms": metrics.e2e_processing_time_ms,
+                }
 
-        await self.push_frame(frame, direction)
+                # Send the data to the client via RTVI
+                rtvi_frame = RTVIServerMessageFrame(data=smart_turn_data)
+                await self.push_frame(rtvi_frame, FrameDirection.UPSTREAM)
 
 
-class TranscriptionBroadcastProcessor(FrameProcessor):
+class TranscriptionBroadcastProcessor(FrameDispatchProcessor):
     """Broadcasts transcription updates to RTVI clients and backend logs."""
 
-    def __init__(self, rtvi: RTVIProcessor, history: ConversationHistory):
+    def __init__(self, rtvi: RTVIProcessor | None, history: ConversationHistory):
         super().__init__()
         self._rtvi = rtvi
         self._history = history
+        if rtvi is None:
+            self._send_user_transcription = _noop_async
+        self._last_summary_key: tuple[int, float] | None = None
+        self._last_summary_value: list[str] = []
+        self._handlers = {
+            InterimTranscriptionFrame: self._on_interim_transcription,
+            TranscriptionFrame: self._on_transcription,
+        }
 
     async def _send_user_transcription(self, frame: TranscriptionFrame | InterimTranscriptionFrame, *, final: bool):
-        if not self._rtvi:
-            return
         message = RTVIUserTranscriptionMessage(
             data=RTVIUserTranscriptionMessageData(
                 text=frame.text,
@@ -244,80 +345,132 @@ class TranscriptionBroadcastProcessor(FrameProcessor):
         await self._rtvi.push_transport_message(message)
 
     async def _log_summary(self):
-        recent_entries = self._history.recent(SUMMARY_WINDOW_SECS)
-        bullets = build_summary(recent_entries)
+        # Only the newest entries end up in the summary, so stop iterating once we have them.
+        newest = self._history.recent_iter(SUMMARY_WINDOW_SECS, reverse=True)
+        recent_entries = list(islice(newest, SUMMARY_MAX_ENTRIES))[::-1]
+        # Repeated summary commands over the same entries reuse the previous bullets.
+        key = (len(recent_entries), recent_entries[-1].timestamp if recent_entries else 0.0)
+        if key == self._last_summary_key:
+            bullets = self._last_summary_value
+        else:
+            bullets = build_summary(recent_entries)
+            self._last_summary_key = key
+            self._last_summary_value = bullets
         if not bullets:
             logger.info("Summary requested but no recent conversation to summarize.")
             return
 
-        logger.info("Summary of the last %.0f seconds:", SUMMARY_WINDOW_SECS)
+        logger.info("Summary of the last {:.0f} seconds:", SUMMARY_WINDOW_SECS)
         for bullet in bullets:
-            logger.info(" • %s", bullet)
-
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
-
-        if isinstance(frame, InterimTranscriptionFrame):
-            logger.debug("User interim transcript: %s", frame.text)
-            await self._send_user_transcription(frame, final=False)
-        elif isinstance(frame, TranscriptionFrame):
-            logger.info("User transcript: %s", frame.text)
-            sanitized = sanitize_command(frame.text)
-            is_summary = sanitized in SUMMARY_COMMANDS if sanitized else False
-            self._history.add("user", frame.text, is_command=is_summary)
-            await self._send_user_transcription(frame, final=True)
-            if is_summary:
-                await self._log_summary()
-
-        await self.push_frame(frame, direction)
-
-
-class LLMOutputBroadcastProcessor(FrameProcessor):
+            logger.info(" • {}", bullet)
+
+    async def _on_interim_transcription(self, frame: InterimTranscriptionFrame):
+        if _DEBUG_ENABLED:
+            logger.debug("User interim transcript: {}", frame.text)
+        await self._send_user_transcription(frame, final=False)
+
+    async def _on_transcription(self, frame: TranscriptionFrame):
+        logger.info("User transcript: {}", frame.text)
+        raw = frame.text
+        is_summary = False
+        # Longer utterances cannot be a bare command, so skip sanitizing them.
+        if raw and len(raw) <= SUMMARY_COMMAND_MAX_CHARS:
+            is_summary = sanitize_command(raw) in SUMMARY_COMMANDS
+        self._history.add("user", frame.text, is_command=is_summary)
+        await self._send_user_transcription(frame, final=True)
+        if is_summary:
+            await self._log_summary()
+
+
+class LLMOutputBroadcastProcessor(FrameDispatchProcessor):
     """Streams LLM text outputs to RTVI clients and logs bot responses."""
 
-    def __init__(self, rtvi: RTVIProcessor, history: ConversationHistory):
+    def __init__(self, rtvi: RTVIProcessor | None, history: ConversationHistory):
         super().__init__()
         self._rtvi = rtvi
         self._history = history
-        self._buffer: list[str] = []
+        if rtvi is None:
+            self._send_llm_chunk = _noop_async
+        self._buffer = io.StringIO()
+        self._chunk_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._chunks_pending = asyncio.Event()
+        self._chunk_lock = asyncio.Lock()
+        self._flusher_task: asyncio.Task | None = None
+        self._handlers = {
+            LLMFullResponseStartFrame: self._on_llm_response_start,
+            LLMTextFrame: self._on_llm_text,
+            LLMFullResponseEndFrame: self._on_llm_response_end,
+        }
 
     async def _send_llm_chunk(self, text: str):
-        if not self._rtvi:
-            return
-        message = RTVIBotLLMTextMessage(data=RTVITextMessageData(text=text))
-        await self._rtvi.push_transport_message(message)
+        self._chunk_queue.put_nowait(text)
+        self._chunks_pending.set()
+        if not self._flusher_task:
+            self._flusher_task = self.create_task(self._flusher_task_handler())
+
+    async def _flusher_task_handler(self):
+        # Coalesce the chunks that arrive within a short window into one message.
+        while True:
+            await self._chunks_pending.wait()
+            await asyncio.sleep(LLM_CHUNK_FLUSH_SECS)
+            await self._flush_llm_chunks()
+
+    async def _flush_llm_chunks(self):
+        async with self._chunk_lock:
+            self._chunks_pending.clear()
+            chunks = []
+            while not self._chunk_queue.empty():
+                chunks.append(self._chunk_queue.get_nowait())
+            if not chunks:
+                return
+            message = RTVIBotLLMTextMessage(data=RTVITextMessageData(text="".join(chunks)))
+            await self._rtvi.push_transport_message(message)
 
     async def _flush_bot_transcript(self):
-        if not self._buffer:
-            return
-        full_text = "".join(self._buffer).strip()
-        self._buffer.clear()
+        full_text = self._buffer.getvalue().strip()
+        self._buffer = io.StringIO()
         if not full_text:
             return
 
-        logger.info("Bot response: %s", full_text)
+        logger.info("Bot response: {}", full_text)
         self._history.add("bot", full_text)
         if self._rtvi:
             message = RTVIBotTranscriptionMessage(data=RTVITextMessageData(text=full_text))
             await self._rtvi.push_transport_message(message)
 
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
+    async def _on_llm_response_start(self, frame: LLMFullResponseStartFrame):
+        self._buffer = io.StringIO()
 
-        if isinstance(frame, LLMFullResponseStartFrame):
-            self._buffer.clear()
-        elif isinstance(frame, LLMTextFrame):
-            if frame.text:
-                logger.debug("Bot LLM chunk: %s", frame.text)
-                self._buffer.append(frame.text)
-                await self._send_llm_chunk(frame.text)
-        elif isinstance(frame, LLMFullResponseEndFrame):
-            await self._flush_bot_transcript()
+    async def _on_llm_text(self, frame: LLMTextFrame):
+        if frame.text:
+            if _DEBUG_ENABLED:
+                logger.debug("Bot LLM chunk: {}", frame.text)
+            self._buffer.write(frame.text)
+            await self._send_llm_chunk(frame.text)
 
-        await self.push_frame(frame, direction)
+    async def _on_llm_response_end(self, frame: LLMFullResponseEndFrame):
+        await self._flush_llm_chunks()
+        await self._flush_bot_transcript()
+
+    async def cleanup(self):
+        await super().cleanup()
+        if self._flusher_task:
+            await self.cancel_task(self._flusher_task)
+            self._flusher_task = None
 
 
-async def main(transport: DailyTransport):
+async def main(transport: "DailyTransport"):
+    from deepgram.clients.listen.v1.websocket.options import LiveOptions
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+    from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
+    from pipecat.services.deepgram.stt import DeepgramSTTService
+    from pipecat.services.google.llm import GoogleLLMService
+
+    # Decode the sprites off the event loop; later sessions hit the cache.
+    quiet_frame, talking_frame = await asyncio.to_thread(_load_sprites)
+
     # Configure your STT and LLM services here
     # Swap out different processors or properties to customize your bot
     stt = DeepgramSTTService(
@@ -349,7 +502,7 @@ async def main(transport: DailyTransport):
     context = OpenAILLMContext(messages)
     context_aggregator = llm.create_context_aggregator(context)
 
-    ta = TalkingAnimation()
+    ta = TalkingAnimation(quiet_frame, talking_frame)
     smart_turn_metrics_processor = SmartTurnMetricsProcessor()
     conversation_history = ConversationHistory()
 
@@ -408,7 +561,7 @@ async def main(transport: DailyTransport):
     await runner.run(task)
 
 
-async def bot(args: DailySessionArguments):
+async def bot(args: "DailySessionArguments"):
     """Main bot entry point compatible with the FastAPI route handler.
 
     Args:
@@ -417,7 +570,12 @@ async def bot(args: DailySessionArguments):
         body: The configuration object from the request body
         session_id: The session ID for logging
     """
+    import aiohttp
     from pipecat.audio.filters.krisp_filter import KrispFilter
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    from pipecat.audio.vad.vad_analyzer import VADParams
+    from pipecat.transports.daily.transport import DailyParams, DailyTransport
 
     logger.info(f"Bot process initialized {args.room_url} {args.token}")
     async with aiohttp.ClientSession() as session:
@@ -448,6 +606,11 @@ async def bot(args: DailySessionArguments):
 # Local development
 async def local_daily():
     """Daily transport for local development."""
+    import aiohttp
+    from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
+    from pipecat.audio.vad.silero import SileroVADAnalyzer
+    from pipecat.audio.vad.vad_analyzer import VADParams
+    from pipecat.transports.daily.transport import DailyParams, DailyTransport
     from runner import configure
 
     try:
@@ -476,6 +639,12 @@ async def local_daily():
 # Local development entry point
 if LOCAL and __name__ == "__main__":
     try:
-        asyncio.run(local_daily())
+        from uvloop import run
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        run = asyncio.run
+
+    try:
+        run(local_daily())
     except Exception as e:
         logger.exception(f"Failed to run in local mode: {e}")